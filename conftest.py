@@ -0,0 +1,8 @@
+import logging
+
+from config import settings
+
+# Importing config attaches a file handler to the root logger; keep test
+# runs from appending to the tracked logs/bot.log.
+logging.getLogger().removeHandler(settings.file_handler)
+settings.file_handler.close()
@@ -1 +1,4 @@
 from .binance_client import BinanceExchangeClient
+from .stream_client import BinanceStreamClient
+from .models import Order, Balance, Ticker
+from .request_cache import RequestCache
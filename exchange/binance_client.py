@@ -1,29 +1,77 @@
 import logging
 from binance import Client
-from binance.exceptions import BinanceAPIException
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+try:
+    import orjson as _json
+except ImportError:  # fall back to the standard library parser
+    import json as _json
 
 from config import (
     BINANCE_API_KEY,
     BINANCE_API_SECRET,
     USE_TESTNET,
 )
+from .models import Order, Balance, Ticker
+from .request_cache import RequestCache
 
 # -----------------------------
 # Logger for this module
 # -----------------------------
 logger = logging.getLogger(__name__)
 
+# -----------------------------
+# Read Cache TTLs (seconds)
+# -----------------------------
+TICKER_TTL = 0.25
+ACCOUNT_TTL = 1.0
+OPEN_ORDERS_TTL = 0.5
+EXCHANGE_INFO_TTL = 60.0
+
+# Aggregate trade paging limits
+AGG_TRADES_PAGE_LIMIT = 1000
+AGG_TRADES_MAX_WINDOW_MS = 60 * 60 * 1000
+
+# Cached endpoints that any order placement or cancellation can change
+ORDER_STATE_ENDPOINTS = ("account", "open_orders")
+
+
+class FastJsonClient(Client):
+    """
+    python-binance Client that parses response bytes with orjson
+    (when installed) instead of requests' text-then-json path.
+    """
+
+    @staticmethod
+    def _handle_response(response):
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+
+        body = response.content
+        if not body:
+            return {}
+
+        try:
+            return _json.loads(body)
+        except ValueError:
+            raise BinanceRequestException("Invalid Response: %s" % response.text)
+
 
 class BinanceExchangeClient:
-    def __init__(self):
-        if not BINANCE_API_KEY or not BINANCE_API_SECRET:
-            raise ValueError("Binance API key/secret not found in config.")
-
-        self.client = Client(
-            api_key=BINANCE_API_KEY,
-            api_secret=BINANCE_API_SECRET,
-            testnet=USE_TESTNET
-        )
+    def __init__(self, client=None):
+        # An SDK client can be injected (e.g. a stub in tests)
+        if client is not None:
+            self.client = client
+        else:
+            if not BINANCE_API_KEY or not BINANCE_API_SECRET:
+                raise ValueError("Binance API key/secret not found in config.")
+
+            self.client = FastJsonClient(
+                api_key=BINANCE_API_KEY,
+                api_secret=BINANCE_API_SECRET,
+                testnet=USE_TESTNET
+            )
+        self._cache = RequestCache()
 
         logger.info("BinanceExchangeClient initialized (testnet=%s)", USE_TESTNET)
 
@@ -32,26 +80,86 @@ class BinanceExchangeClient:
     # -----------------------------
     def get_last_price(self, symbol: str) -> float:
         try:
-            ticker = self.client.get_symbol_ticker(symbol=symbol)
-            price = float(ticker["price"])
-            logger.info("Fetched price for %s: %s", symbol, price)
-            return price
+            ticker = self._cache.get(
+                ("ticker", symbol),
+                TICKER_TTL,
+                lambda: self._fetch_ticker(symbol)
+            )
+            return ticker.price
         except BinanceAPIException as e:
             logger.exception("Error fetching price for %s: %s", symbol, e)
             raise
 
+    def _fetch_ticker(self, symbol: str) -> Ticker:
+        ticker = Ticker.from_raw(self.client.get_symbol_ticker(symbol=symbol))
+        logger.info("Fetched price for %s: %s", symbol, ticker.price)
+        return ticker
+
+    def get_recent_volume(self, symbol: str, start_time: int, end_time: int) -> float:
+        """
+        Base-asset volume traded on the symbol between start_time and
+        end_time (ms, inclusive). Pages through every aggregate trade in the
+        window rather than stopping at the 1000-trade response limit.
+        """
+        try:
+            volume = 0.0
+
+            # Binance caps a startTime/endTime query at one hour
+            chunk_start = start_time
+            while chunk_start <= end_time:
+                chunk_end = min(chunk_start + AGG_TRADES_MAX_WINDOW_MS - 1, end_time)
+                trades = self.client.get_aggregate_trades(
+                    symbol=symbol,
+                    startTime=chunk_start,
+                    endTime=chunk_end,
+                    limit=AGG_TRADES_PAGE_LIMIT
+                )
+
+                while trades:
+                    in_window = [t for t in trades if t["T"] <= chunk_end]
+                    volume += sum(float(t["q"]) for t in in_window)
+
+                    if len(trades) < AGG_TRADES_PAGE_LIMIT or len(in_window) < len(trades):
+                        break
+
+                    trades = self.client.get_aggregate_trades(
+                        symbol=symbol,
+                        fromId=trades[-1]["a"] + 1,
+                        limit=AGG_TRADES_PAGE_LIMIT
+                    )
+
+                chunk_start = chunk_end + 1
+
+            logger.info("Fetched recent volume for %s: %s", symbol, volume)
+            return volume
+        except BinanceAPIException as e:
+            logger.exception("Error fetching recent volume for %s: %s", symbol, e)
+            raise
+
     # -----------------------------
     # Account Info
     # -----------------------------
     def get_account_info(self):
         try:
-            info = self.client.get_account()
-            logger.info("Fetched account info")
+            info, _ = self._get_account()
             return info
         except BinanceAPIException as e:
             logger.exception("Error fetching account info: %s", e)
             raise
 
+    def _get_account(self):
+        """
+        Cached (account payload, parsed balances) pair. Balances live in the
+        same entry so they can never outlive the account they came from.
+        """
+        return self._cache.get(("account",), ACCOUNT_TTL, self._fetch_account)
+
+    def _fetch_account(self):
+        account = self.client.get_account()
+        balances = [Balance.from_raw(b) for b in account.get("balances", [])]
+        logger.info("Fetched account info")
+        return account, balances
+
     # -----------------------------
     # Orders
     # -----------------------------
@@ -69,8 +177,9 @@ class BinanceExchangeClient:
                 quantity=quantity
             )
 
+            self._cache.invalidate(*ORDER_STATE_ENDPOINTS)
             logger.info("Market order response: %s", order)
-            return order
+            return Order.from_raw(order)
 
         except BinanceAPIException as e:
             logger.exception("Market order failed: %s", e)
@@ -99,8 +208,9 @@ class BinanceExchangeClient:
                 price=str(price)
             )
 
+            self._cache.invalidate(*ORDER_STATE_ENDPOINTS)
             logger.info("Limit order response: %s", order)
-            return order
+            return Order.from_raw(order)
 
         except BinanceAPIException as e:
             logger.exception("Limit order failed: %s", e)
@@ -111,18 +221,26 @@ class BinanceExchangeClient:
     # -----------------------------
     def get_open_orders(self, symbol: str | None = None):
         try:
-            if symbol:
-                orders = self.client.get_open_orders(symbol=symbol)
-            else:
-                orders = self.client.get_open_orders()
-
-            logger.info("Fetched open orders")
-            return orders
+            orders = self._cache.get(
+                ("open_orders", symbol),
+                OPEN_ORDERS_TTL,
+                lambda: self._fetch_open_orders(symbol)
+            )
+            return list(orders)
 
         except BinanceAPIException as e:
             logger.exception("Error fetching open orders: %s", e)
             raise
 
+    def _fetch_open_orders(self, symbol: str | None):
+        if symbol:
+            orders = self.client.get_open_orders(symbol=symbol)
+        else:
+            orders = self.client.get_open_orders()
+
+        logger.info("Fetched open orders")
+        return [Order.from_raw(o) for o in orders]
+
     def cancel_order(self, symbol: str, order_id: int):
         try:
             logger.info("Cancelling order %s on %s", order_id, symbol)
@@ -132,8 +250,9 @@ class BinanceExchangeClient:
                 orderId=order_id
             )
 
+            self._cache.invalidate(*ORDER_STATE_ENDPOINTS)
             logger.info("Cancel response: %s", result)
-            return result
+            return Order.from_raw(result)
 
         except BinanceAPIException as e:
             logger.exception("Order cancellation failed: %s", e)
@@ -163,8 +282,9 @@ class BinanceExchangeClient:
                 stopPrice=str(stop_price)
             )
 
+            self._cache.invalidate(*ORDER_STATE_ENDPOINTS)
             logger.info("Stop-Limit order response: %s", order)
-            return order
+            return Order.from_raw(order)
 
         except BinanceAPIException as e:
             logger.exception("Stop-Limit order failed: %s", e)
@@ -176,7 +296,7 @@ class BinanceExchangeClient:
                 orderId=order_id
             )
             logger.info("Fetched order by ID %s: %s", order_id, order)
-            return order
+            return Order.from_raw(order)
 
         except BinanceAPIException as e:
             logger.exception("Error fetching order %s: %s", order_id, e)
@@ -186,45 +306,53 @@ class BinanceExchangeClient:
     # -----------------------------
     def get_balances(self):
         try:
-            account = self.client.get_account()
-            balances = account.get("balances", [])
-            logger.info("Fetched balances")
-            return balances
+            # Shares the cached account payload with get_account_info
+            _, balances = self._get_account()
+            return list(balances)
         except BinanceAPIException as e:
             logger.exception("Error fetching balances: %s", e)
             raise
 
     # -----------------------------
-    # Open Orders
-    # -----------------------------
-    def get_open_orders(self, symbol: str | None = None):
-        try:
-            if symbol:
-                orders = self.client.get_open_orders(symbol=symbol)
-            else:
-                orders = self.client.get_open_orders()
-
-            logger.info("Fetched open orders")
-            return orders
-
-        except BinanceAPIException as e:
-            logger.exception("Error fetching open orders: %s", e)
-            raise
-    # -----------------------------
     # Symbol Trading Rules
     # -----------------------------
     def get_symbol_filters(self, symbol: str):
         try:
-            exchange_info = self.client.get_exchange_info()
+            info = self._get_symbol_info(symbol)
+            filters = {f["filterType"]: f for f in info["filters"]}
+            logger.info("Resolved filters for %s", symbol)
+            return filters
 
-            for s in exchange_info["symbols"]:
-                if s["symbol"] == symbol:
-                    filters = {f["filterType"]: f for f in s["filters"]}
-                    logger.info("Fetched filters for %s", symbol)
-                    return filters
+        except BinanceAPIException as e:
+            logger.exception("Error fetching symbol filters for %s: %s", symbol, e)
+            raise
 
-            raise ValueError(f"Symbol not found: {symbol}")
+    def get_symbol_assets(self, symbol: str) -> tuple:
+        """
+        (base asset, quote asset) of the symbol, e.g. ("BTC", "USDT").
+        """
+        try:
+            info = self._get_symbol_info(symbol)
+            return info["baseAsset"], info["quoteAsset"]
 
         except BinanceAPIException as e:
-            logger.exception("Error fetching symbol filters for %s: %s", symbol, e)
+            logger.exception("Error fetching symbol assets for %s: %s", symbol, e)
             raise
+
+    def _get_symbol_info(self, symbol: str) -> dict:
+        exchange_info = self._cache.get(
+            ("exchange_info",),
+            EXCHANGE_INFO_TTL,
+            self._fetch_exchange_info
+        )
+
+        for s in exchange_info["symbols"]:
+            if s["symbol"] == symbol:
+                return s
+
+        raise ValueError(f"Symbol not found: {symbol}")
+
+    def _fetch_exchange_info(self):
+        exchange_info = self.client.get_exchange_info()
+        logger.info("Fetched exchange info")
+        return exchange_info
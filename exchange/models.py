@@ -0,0 +1,133 @@
+"""
+Compact record types for exchange payloads.
+
+Numeric fields are parsed from Binance's string encoding once, at
+construction, and stored in __slots__ so holding many records stays cheap.
+"""
+
+
+def _to_float(value):
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+class Order:
+    __slots__ = (
+        "order_id",
+        "symbol",
+        "side",
+        "type",
+        "status",
+        "price",
+        "orig_qty",
+        "executed_qty",
+        "quote_qty",
+        "stop_price",
+    )
+
+    def __init__(self, order_id, symbol, side, order_type, status, price,
+                 orig_qty, executed_qty, quote_qty=None, stop_price=None):
+        self.order_id = order_id
+        self.symbol = symbol
+        self.side = side
+        self.type = order_type
+        self.status = status
+        self.price = price
+        self.orig_qty = orig_qty
+        self.executed_qty = executed_qty
+        self.quote_qty = quote_qty
+        self.stop_price = stop_price
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> "Order":
+        """
+        Builds an order from a REST order payload (including ACK-only ones).
+        """
+        return cls(
+            order_id=raw.get("orderId"),
+            symbol=raw.get("symbol"),
+            side=raw.get("side"),
+            order_type=raw.get("type"),
+            status=raw.get("status"),
+            price=_to_float(raw.get("price")),
+            orig_qty=_to_float(raw.get("origQty")),
+            executed_qty=_to_float(raw.get("executedQty")),
+            quote_qty=_to_float(raw.get("cummulativeQuoteQty")),
+            stop_price=_to_float(raw.get("stopPrice")),
+        )
+
+    @classmethod
+    def from_execution_report(cls, msg: dict) -> "Order":
+        """
+        Builds an order from a user data stream executionReport event.
+        """
+        return cls(
+            order_id=msg["i"],
+            symbol=msg["s"],
+            side=msg["S"],
+            order_type=msg["o"],
+            status=msg["X"],
+            price=_to_float(msg.get("p")),
+            orig_qty=_to_float(msg.get("q")),
+            executed_qty=_to_float(msg.get("z")),
+            quote_qty=_to_float(msg.get("Z")),
+            stop_price=_to_float(msg.get("P")),
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "order_id": self.order_id,
+            "symbol": self.symbol,
+            "side": self.side,
+            "type": self.type,
+            "status": self.status,
+            "price": self.price,
+            "orig_qty": self.orig_qty,
+            "executed_qty": self.executed_qty,
+        }
+
+    def __repr__(self):
+        return (
+            f"Order(order_id={self.order_id}, symbol={self.symbol}, side={self.side}, "
+            f"type={self.type}, status={self.status}, price={self.price}, "
+            f"orig_qty={self.orig_qty}, executed_qty={self.executed_qty})"
+        )
+
+
+class Balance:
+    __slots__ = ("asset", "free", "locked")
+
+    def __init__(self, asset: str, free: float, locked: float):
+        self.asset = asset
+        self.free = free
+        self.locked = locked
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> "Balance":
+        return cls(raw["asset"], float(raw["free"]), float(raw["locked"]))
+
+    @classmethod
+    def from_account_position(cls, raw: dict) -> "Balance":
+        """
+        Builds a balance from an outboundAccountPosition stream entry.
+        """
+        return cls(raw["a"], float(raw["f"]), float(raw["l"]))
+
+    def __repr__(self):
+        return f"Balance(asset={self.asset}, free={self.free}, locked={self.locked})"
+
+
+class Ticker:
+    __slots__ = ("symbol", "price")
+
+    def __init__(self, symbol: str, price: float):
+        self.symbol = symbol
+        self.price = price
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> "Ticker":
+        return cls(raw["symbol"], float(raw["price"]))
+
+    def __repr__(self):
+        return f"Ticker(symbol={self.symbol}, price={self.price})"
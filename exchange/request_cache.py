@@ -0,0 +1,77 @@
+import threading
+import time
+
+
+class _Flight:
+    """
+    One in-flight load that concurrent callers for the same key wait on.
+    """
+
+    __slots__ = ("event", "result", "error", "stale")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.stale = False
+
+
+class RequestCache:
+    """
+    Single-flight read cache with short per-entry TTLs.
+
+    Concurrent callers asking for the same key share one request, and the
+    result is served from memory until its TTL runs out. Keys are tuples
+    whose first element names the endpoint, so writes can invalidate every
+    entry of an endpoint at once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._in_flight = {}
+
+    def get(self, key: tuple, ttl: float, loader):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._in_flight[key] = flight
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        succeeded = False
+        try:
+            flight.result = loader()
+            succeeded = True
+            return flight.result
+        except BaseException as e:
+            # Followers re-raise the leader's error rather than get None
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                # A write that landed mid-request makes this result stale
+                if succeeded and not flight.stale:
+                    self._entries[key] = (time.monotonic() + ttl, flight.result)
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+            flight.event.set()
+
+    def invalidate(self, *endpoints: str):
+        with self._lock:
+            for key in [k for k in self._entries if k[0] in endpoints]:
+                del self._entries[key]
+
+            # Later callers must not join a request that started before the write
+            for key in [k for k in self._in_flight if k[0] in endpoints]:
+                self._in_flight.pop(key).stale = True
@@ -0,0 +1,93 @@
+import logging
+from binance import ThreadedWebsocketManager
+
+from config import (
+    BINANCE_API_KEY,
+    BINANCE_API_SECRET,
+    USE_TESTNET,
+)
+
+# -----------------------------
+# Logger for this module
+# -----------------------------
+logger = logging.getLogger(__name__)
+
+
+class BinanceStreamClient:
+    """
+    Thin wrapper around python-binance's ThreadedWebsocketManager.
+    Callbacks run on the manager's background thread.
+    """
+
+    def __init__(self):
+        if not BINANCE_API_KEY or not BINANCE_API_SECRET:
+            raise ValueError("Binance API key/secret not found in config.")
+
+        self.manager = ThreadedWebsocketManager(
+            api_key=BINANCE_API_KEY,
+            api_secret=BINANCE_API_SECRET,
+            testnet=USE_TESTNET
+        )
+        self._started = False
+
+        logger.info("BinanceStreamClient initialized (testnet=%s)", USE_TESTNET)
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+    def start(self):
+        if not self._started:
+            self.manager.start()
+            self._started = True
+            logger.info("Stream manager started")
+
+    def stop(self):
+        if self._started:
+            self.manager.stop()
+            self._started = False
+            logger.info("Stream manager stopped")
+
+    # -----------------------------
+    # Subscriptions
+    # -----------------------------
+    def subscribe_user_data(self, callback, on_error=None):
+        self.start()
+        logger.info("Subscribing to user data stream")
+        return self.manager.start_user_socket(
+            callback=self._guard(callback, "user data", on_error)
+        )
+
+    def subscribe_mini_ticker(self, symbol: str, callback, on_error=None):
+        self.start()
+        logger.info("Subscribing to mini ticker for %s", symbol)
+        return self.manager.start_symbol_miniticker_socket(
+            callback=self._guard(callback, symbol, on_error),
+            symbol=symbol
+        )
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+    def _guard(self, callback, stream_name: str, on_error=None):
+        """
+        Keeps a bad message or a failing callback from killing the socket thread.
+        Error messages (disconnects, reconnects) go to on_error, since events
+        may have been missed and the caller's state needs reconciling.
+        """
+
+        def handler(msg):
+            if isinstance(msg, dict) and msg.get("e") == "error":
+                logger.error("Stream error on %s: %s", stream_name, msg)
+                if on_error is not None:
+                    try:
+                        on_error(msg)
+                    except Exception as e:
+                        logger.exception("Stream error handler failed on %s: %s", stream_name, e)
+                return
+
+            try:
+                callback(msg)
+            except Exception as e:
+                logger.exception("Stream callback failed on %s: %s", stream_name, e)
+
+        return handler
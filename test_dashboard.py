@@ -0,0 +1,121 @@
+import io
+
+from exchange import Balance, Order
+from ui.dashboard import DashboardState, LiveDashboard
+
+
+def execution_report(order_id, status, exec_type="NEW", last_qty="0", last_price="0"):
+    return {
+        "e": "executionReport", "i": order_id, "s": "BTCUSDT", "S": "BUY",
+        "o": "LIMIT", "p": "100", "q": "1", "z": "0", "Z": "0", "X": status,
+        "x": exec_type, "l": last_qty, "L": last_price, "T": 1700000000000,
+    }
+
+
+def open_order(order_id):
+    return Order(order_id, "BTCUSDT", "BUY", "LIMIT", "NEW", 100.0, 1.0, 0.0)
+
+
+class StubEngine:
+    def __init__(self, balances=None, open_orders=None):
+        self.balances = balances or []
+        self.open_orders = open_orders or []
+
+    def get_balances(self):
+        return self.balances
+
+    def get_open_orders(self, symbol=None):
+        return self.open_orders
+
+    def get_symbol_assets(self, symbol):
+        return {"SOLUSDT": ("SOL", "USDT")}[symbol]
+
+
+def test_event_before_seed_is_replayed_on_top_of_snapshot():
+    state = DashboardState()
+    state.on_user_event({"e": "outboundAccountPosition", "B": [{"a": "BTC", "f": "2", "l": "0"}]})
+    state.on_user_event(execution_report(7, "NEW"))
+
+    # Nothing is applied before the seed
+    assert state.balances == {}
+
+    state.load_snapshot([Balance("BTC", 1.0, 0.0), Balance("USDT", 5.0, 0.0)], [])
+
+    assert state.balances["BTC"].free == 2.0
+    assert state.balances["USDT"].free == 5.0
+    assert list(state.open_orders) == [7]
+
+
+def test_terminal_execution_report_removes_order_and_records_fill():
+    state = DashboardState()
+    state.load_snapshot([], [open_order(1), open_order(2)])
+
+    state.on_user_event(execution_report(1, "FILLED", "TRADE", last_qty="1", last_price="100"))
+    state.on_user_event(execution_report(2, "CANCELED", "CANCELED"))
+
+    assert state.open_orders == {}
+    assert state.fills[0]["qty"] == 1.0
+    assert state.fills[0]["price"] == 100.0
+
+
+def test_stream_error_marks_stale_and_buffers_until_reseed():
+    state = DashboardState()
+    state.load_snapshot([Balance("BTC", 1.0, 0.0)], [])
+
+    state.mark_stale({"e": "error", "m": "connection lost"})
+    state.on_user_event({"e": "outboundAccountPosition", "B": [{"a": "BTC", "f": "3", "l": "0"}]})
+
+    assert state.snapshot()["stale"]
+    assert state.balances["BTC"].free == 1.0
+
+    state.load_snapshot([Balance("BTC", 2.0, 0.0)], [])
+
+    assert not state.snapshot()["stale"]
+    assert state.balances["BTC"].free == 3.0
+
+
+def test_stale_state_is_shown_in_header():
+    dashboard = LiveDashboard(StubEngine(), ["BTCUSDT"], out=io.StringIO())
+    dashboard.seed()
+    dashboard.state.mark_stale()
+    dashboard.refresh()
+
+    assert "STALE" in dashboard._previous_lines[0]
+
+
+def test_unchanged_frame_writes_nothing():
+    out = io.StringIO()
+    dashboard = LiveDashboard(StubEngine(), ["BTCUSDT"], out=out)
+
+    dashboard._draw(["a", "b", "c"])
+    written = out.getvalue()
+    dashboard._draw(["a", "b", "c"])
+
+    assert out.getvalue() == written
+
+
+def test_only_changed_lines_are_redrawn():
+    out = io.StringIO()
+    dashboard = LiveDashboard(StubEngine(), ["BTCUSDT"], out=out)
+
+    dashboard._draw(["a", "b", "c"])
+    out.seek(0)
+    out.truncate()
+    dashboard._draw(["a", "B"])
+
+    assert out.getvalue() == "\x1b[2;1HB\x1b[K\x1b[3;1H\x1b[J"
+
+
+def test_only_watched_assets_are_listed():
+    engine = StubEngine(balances=[
+        Balance("BTC", 1.0, 0.0),
+        Balance("SOL", 1.0, 0.0),
+        Balance("T", 1.0, 0.0),
+    ])
+    dashboard = LiveDashboard(engine, ["SOLUSDT"], out=io.StringIO())
+    dashboard.resolve_assets()
+    dashboard.seed()
+    dashboard.refresh()
+
+    balance_lines = [line for line in dashboard._previous_lines if "Free=" in line]
+    assert [line.split()[0] for line in balance_lines] == ["BTC", "SOL"]
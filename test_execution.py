@@ -0,0 +1,261 @@
+import asyncio
+import time
+
+import pytest
+
+from exchange import BinanceExchangeClient, Order
+from trading import TradeEngine, ExecutionScheduler
+
+
+class StubExchange:
+    """
+    In-memory exchange: market orders fill at fill_price, limit orders rest
+    until polled once, then fill completely. Reported market volume includes
+    the stub's own market fills, as a real trade tape would.
+    """
+
+    def __init__(self, step="0.1", min_qty="0.1", min_notional="1",
+                 arrival_price=100.0, fill_price=101.0, volume=1.0):
+        self.filters = {
+            "LOT_SIZE": {"stepSize": step, "minQty": min_qty, "maxQty": "1000"},
+            "MIN_NOTIONAL": {"minNotional": min_notional},
+        }
+        self.arrival_price = arrival_price
+        self.fill_price = fill_price
+        self.volume = volume
+        self.place_delay = 0.0
+        self.cancel_fill_qty = 0.0
+        self.ack_only = False
+        self.cancel_error = None
+
+        self.market_orders = []
+        self.market_by_id = {}
+        self.limit_orders = {}
+        self.cancelled = []
+        self._unreported_fills = 0.0
+        self._next_id = 1
+
+    def get_symbol_filters(self, symbol):
+        return self.filters
+
+    def get_last_price(self, symbol):
+        return self.arrival_price
+
+    def get_recent_volume(self, symbol, start_time, end_time):
+        volume = self.volume + self._unreported_fills
+        self._unreported_fills = 0.0
+        return volume
+
+    def place_market_order(self, symbol, side, quantity):
+        order_id = self._new_id()
+        self.market_orders.append(quantity)
+        self._unreported_fills += quantity
+        order = Order(order_id, symbol, side, "MARKET", "FILLED", 0.0, quantity,
+                      quantity, quantity * self.fill_price)
+        self.market_by_id[order_id] = order
+
+        if self.ack_only:
+            return Order(order_id, symbol, None, None, None, None, None, None)
+        return order
+
+    def place_limit_order(self, symbol, side, quantity, price):
+        time.sleep(self.place_delay)
+        order_id = self._new_id()
+        self.limit_orders[order_id] = (quantity, price)
+        return Order(order_id, symbol, side, "LIMIT", "NEW", price, quantity, 0.0, 0.0)
+
+    def get_order_by_id(self, symbol, order_id):
+        if order_id in self.market_by_id:
+            return self.market_by_id[order_id]
+
+        quantity, price = self.limit_orders[order_id]
+        return Order(order_id, symbol, None, "LIMIT", "FILLED", price, quantity,
+                     quantity, quantity * price)
+
+    def cancel_order(self, symbol, order_id):
+        if self.cancel_error is not None:
+            raise self.cancel_error
+        self.cancelled.append(order_id)
+        quantity, price = self.limit_orders[order_id]
+        filled = self.cancel_fill_qty
+        return Order(order_id, symbol, None, "LIMIT", "CANCELED", price, quantity,
+                     filled, filled * price)
+
+    def _new_id(self):
+        order_id = self._next_id
+        self._next_id += 1
+        return order_id
+
+
+def make_scheduler(exchange):
+    return ExecutionScheduler(TradeEngine(exchange=exchange))
+
+
+def run_parents(exchange, *parents_data):
+    async def run():
+        scheduler = make_scheduler(exchange)
+        submitted = [await scheduler.submit(p) for p in parents_data]
+        await scheduler.wait()
+        return submitted
+
+    return asyncio.run(run())
+
+
+def test_twap_child_quantities_have_no_float_noise():
+    exchange = StubExchange()
+    (parent,) = run_parents(exchange, {
+        "symbol": "BTCUSDT", "side": "BUY", "strategy": "TWAP",
+        "quantity": 0.7, "duration": 0.06, "slices": 3,
+    })
+
+    assert exchange.market_orders == [0.2, 0.2, 0.3]
+    assert parent.status == "FILLED"
+    assert parent.executed_qty == pytest.approx(0.7)
+
+
+def test_twap_rolls_slices_below_min_notional_forward():
+    exchange = StubExchange(step="0.01", min_qty="0.01", min_notional="10")
+    (parent,) = run_parents(exchange, {
+        "symbol": "BTCUSDT", "side": "BUY", "strategy": "TWAP",
+        "quantity": 0.3, "duration": 0.06, "slices": 6,
+    })
+
+    assert exchange.market_orders == [0.1, 0.1, 0.1]
+    assert parent.status == "FILLED"
+
+
+def test_slippage_sign_follows_side():
+    buy, sell = run_parents(
+        StubExchange(),
+        {"symbol": "BTCUSDT", "side": "BUY", "strategy": "TWAP",
+         "quantity": 0.2, "duration": 0.02, "slices": 2},
+        {"symbol": "BTCUSDT", "side": "SELL", "strategy": "TWAP",
+         "quantity": 0.2, "duration": 0.02, "slices": 2},
+    )
+
+    # Both filled at 101 against an arrival of 100
+    assert buy.slippage_bps == pytest.approx(100)
+    assert sell.slippage_bps == pytest.approx(-100)
+
+
+def test_pov_sizes_children_from_market_volume():
+    exchange = StubExchange(volume=2.0)
+    (parent,) = run_parents(exchange, {
+        "symbol": "BTCUSDT", "side": "BUY", "strategy": "POV",
+        "quantity": 0.5, "participation": 0.1, "interval": 0.01,
+    })
+
+    assert exchange.market_orders == [0.2, 0.2, 0.1]
+    assert parent.status == "FILLED"
+
+
+def test_iceberg_works_visible_slices():
+    exchange = StubExchange()
+    (parent,) = run_parents(exchange, {
+        "symbol": "BTCUSDT", "side": "SELL", "strategy": "ICEBERG",
+        "quantity": 0.5, "price": 100, "visible_quantity": 0.2, "interval": 0.01,
+    })
+
+    assert [q for q, _ in exchange.limit_orders.values()] == [0.2, 0.2, 0.1]
+    assert parent.status == "FILLED"
+    assert parent.avg_price == pytest.approx(100)
+    assert parent.slippage_bps == pytest.approx(0)
+
+
+def test_quantity_below_smallest_lot_is_rejected():
+    async def run():
+        scheduler = make_scheduler(StubExchange())
+        await scheduler.submit({
+            "symbol": "BTCUSDT", "side": "BUY", "strategy": "TWAP",
+            "quantity": 0.05, "duration": 1, "slices": 1,
+        })
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+
+
+def test_cancel_during_placement_cancels_the_placed_slice():
+    exchange = StubExchange()
+    exchange.place_delay = 0.1
+    exchange.cancel_fill_qty = 0.1
+
+    async def run():
+        scheduler = make_scheduler(exchange)
+        parent = await scheduler.submit({
+            "symbol": "BTCUSDT", "side": "BUY", "strategy": "ICEBERG",
+            "quantity": 0.5, "price": 100, "visible_quantity": 0.5, "interval": 1,
+        })
+        await asyncio.sleep(0.02)
+        scheduler.cancel(parent.parent_id)
+        await scheduler.wait()
+        return parent
+
+    parent = asyncio.run(run())
+
+    assert exchange.cancelled == list(exchange.limit_orders)
+    assert parent.status == "CANCELLED"
+    assert parent.working_order_id is None
+    # Partial fill on the cancelled slice is booked on the parent
+    assert parent.executed_qty == pytest.approx(0.1)
+
+
+def test_ack_only_children_are_normalized_before_booking():
+    exchange = StubExchange()
+    exchange.ack_only = True
+    (parent,) = run_parents(exchange, {
+        "symbol": "BTCUSDT", "side": "BUY", "strategy": "TWAP",
+        "quantity": 0.7, "duration": 0.06, "slices": 3,
+    })
+
+    # Booked from the full order, so nothing is re-sent or overfilled
+    assert exchange.market_orders == [0.2, 0.2, 0.3]
+    assert parent.executed_qty == pytest.approx(0.7)
+    assert parent.status == "FILLED"
+
+
+def test_failed_cancel_books_fill_from_order_lookup():
+    exchange = StubExchange()
+    exchange.cancel_error = RuntimeError("Unknown order sent.")
+
+    async def run():
+        scheduler = make_scheduler(exchange)
+        parent = await scheduler.submit({
+            "symbol": "BTCUSDT", "side": "BUY", "strategy": "ICEBERG",
+            "quantity": 0.5, "price": 100, "visible_quantity": 0.5, "interval": 1,
+        })
+        await asyncio.sleep(0.02)
+        await scheduler.cancel_all()
+        return parent
+
+    parent = asyncio.run(run())
+
+    # The slice filled before the cancel landed; the lookup books it
+    assert parent.status == "CANCELLED"
+    assert parent.executed_qty == pytest.approx(0.5)
+    assert parent.working_order_id is None
+    assert parent.summary()["working_order_id"] is None
+
+
+class StubAggTradeClient:
+    """
+    SDK stand-in serving one aggregate trade of quantity 1 per millisecond.
+    """
+
+    def __init__(self, trade_count):
+        self.trades = [{"a": i, "T": i, "q": "1"} for i in range(trade_count)]
+        self.calls = 0
+
+    def get_aggregate_trades(self, symbol, limit, startTime=None, endTime=None, fromId=None):
+        self.calls += 1
+        if fromId is not None:
+            return self.trades[fromId:fromId + limit]
+        in_window = [t for t in self.trades if startTime <= t["T"] <= endTime]
+        return in_window[:limit]
+
+
+def test_recent_volume_pages_past_the_response_limit():
+    client = StubAggTradeClient(trade_count=5000)
+    exchange = BinanceExchangeClient(client=client)
+
+    assert exchange.get_recent_volume("BTCUSDT", 0, 2499) == 2500
+    assert client.calls == 3
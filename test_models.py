@@ -0,0 +1,110 @@
+import pytest
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+from exchange import Balance, Order, Ticker
+from exchange.binance_client import FastJsonClient
+
+
+class StubResponse:
+    def __init__(self, body: bytes, status_code: int = 200):
+        self.content = body
+        self.text = body.decode()
+        self.status_code = status_code
+
+
+def test_order_from_raw_parses_numbers_once():
+    order = Order.from_raw({
+        "orderId": 42, "symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT",
+        "status": "PARTIALLY_FILLED", "price": "60000.00000000",
+        "origQty": "0.00200000", "executedQty": "0.00100000",
+        "cummulativeQuoteQty": "60.00000000", "stopPrice": "0.00000000",
+    })
+
+    assert order.order_id == 42
+    assert order.type == "LIMIT"
+    assert order.price == 60000.0
+    assert order.orig_qty == 0.002
+    assert order.executed_qty == 0.001
+    assert order.quote_qty == 60.0
+    assert order.stop_price == 0.0
+
+
+def test_order_from_ack_response_leaves_missing_fields_none():
+    order = Order.from_raw({"orderId": 42, "symbol": "BTCUSDT", "price": ""})
+
+    assert order.order_id == 42
+    assert order.status is None
+    assert order.price is None
+    assert order.executed_qty is None
+    assert order.quote_qty is None
+
+
+def test_order_from_execution_report():
+    order = Order.from_execution_report({
+        "e": "executionReport", "i": 7, "s": "ETHUSDT", "S": "SELL",
+        "o": "STOP_LOSS_LIMIT", "X": "NEW", "p": "3000", "q": "1.5",
+        "z": "0.5", "Z": "1500", "P": "2950",
+    })
+
+    assert (order.order_id, order.symbol, order.side) == (7, "ETHUSDT", "SELL")
+    assert order.type == "STOP_LOSS_LIMIT"
+    assert order.status == "NEW"
+    assert order.price == 3000.0
+    assert order.orig_qty == 1.5
+    assert order.executed_qty == 0.5
+    assert order.quote_qty == 1500.0
+    assert order.stop_price == 2950.0
+
+
+def test_order_as_dict_keeps_normalized_keys():
+    order = Order(1, "BTCUSDT", "BUY", "MARKET", "FILLED", 0.0, 1.0, 1.0)
+
+    assert list(order.as_dict()) == [
+        "order_id", "symbol", "side", "type", "status",
+        "price", "orig_qty", "executed_qty",
+    ]
+
+
+def test_balance_parsers():
+    rest = Balance.from_raw({"asset": "BTC", "free": "1.5", "locked": "0.25"})
+    stream = Balance.from_account_position({"a": "ETH", "f": "2", "l": "0"})
+
+    assert (rest.asset, rest.free, rest.locked) == ("BTC", 1.5, 0.25)
+    assert (stream.asset, stream.free, stream.locked) == ("ETH", 2.0, 0.0)
+
+
+def test_ticker_from_raw():
+    ticker = Ticker.from_raw({"symbol": "BTCUSDT", "price": "60000.01"})
+
+    assert ticker.price == 60000.01
+
+
+def test_records_are_slotted():
+    with pytest.raises(AttributeError):
+        Balance("BTC", 1.0, 0.0).extra = 1
+
+
+def test_handle_response_decodes_bytes():
+    body = b'{"symbol": "BTCUSDT", "price": "1.0"}'
+
+    assert FastJsonClient._handle_response(StubResponse(body)) == {
+        "symbol": "BTCUSDT", "price": "1.0",
+    }
+
+
+def test_handle_response_empty_body():
+    assert FastJsonClient._handle_response(StubResponse(b"")) == {}
+
+
+def test_handle_response_invalid_json_raises_request_exception():
+    with pytest.raises(BinanceRequestException):
+        FastJsonClient._handle_response(StubResponse(b"<html>bad gateway</html>"))
+
+
+def test_handle_response_error_status_raises_api_exception():
+    body = b'{"code": -1121, "msg": "Invalid symbol."}'
+
+    with pytest.raises(BinanceAPIException) as exc:
+        FastJsonClient._handle_response(StubResponse(body, status_code=400))
+
+    assert exc.value.code == -1121
@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+
+from exchange import RequestCache
+
+
+class SlowLoader:
+    """
+    Loader that blocks until released, counting how often it really runs.
+    """
+
+    def __init__(self, result="value", error=None):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def call_concurrently(cache, key, loader, count=8):
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(cache.get(key, 10.0, loader))
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for t in threads:
+        t.start()
+
+    loader.started.wait(timeout=5)
+    time.sleep(0.05)  # let every follower join the flight
+    loader.release.set()
+
+    for t in threads:
+        t.join(timeout=5)
+    return results, errors
+
+
+def test_concurrent_reads_share_one_request():
+    cache = RequestCache()
+    loader = SlowLoader()
+
+    results, errors = call_concurrently(cache, ("account",), loader)
+
+    assert loader.calls == 1
+    assert results == ["value"] * 8
+    assert errors == []
+
+    # Served from cache afterwards
+    assert cache.get(("account",), 10.0, loader) == "value"
+    assert loader.calls == 1
+
+
+def test_entry_expires_after_ttl():
+    cache = RequestCache()
+    calls = []
+    loader = lambda: calls.append(1) or len(calls)
+
+    assert cache.get(("ticker", "BTCUSDT"), 0.01, loader) == 1
+    time.sleep(0.02)
+    assert cache.get(("ticker", "BTCUSDT"), 0.01, loader) == 2
+
+
+def test_invalidate_drops_entries_of_that_endpoint_only():
+    cache = RequestCache()
+    cache.get(("open_orders", None), 10.0, lambda: "orders")
+    cache.get(("ticker", "BTCUSDT"), 10.0, lambda: "ticker")
+
+    cache.invalidate("open_orders")
+
+    assert cache.get(("open_orders", None), 10.0, lambda: "fresh") == "fresh"
+    assert cache.get(("ticker", "BTCUSDT"), 10.0, lambda: "fresh") == "ticker"
+
+
+def test_invalidate_during_request_is_not_cached():
+    cache = RequestCache()
+    loader = SlowLoader(result="before write")
+
+    thread = threading.Thread(target=cache.get, args=(("account",), 10.0, loader))
+    thread.start()
+    loader.started.wait(timeout=5)
+
+    cache.invalidate("account")
+
+    # A caller after the write must not join the stale request
+    assert cache.get(("account",), 10.0, lambda: "after write") == "after write"
+
+    loader.release.set()
+    thread.join(timeout=5)
+
+    assert cache.get(("account",), 10.0, lambda: "unexpected") == "after write"
+
+
+def test_errors_fan_out_and_are_not_cached():
+    cache = RequestCache()
+    loader = SlowLoader(error=RuntimeError("boom"))
+
+    results, errors = call_concurrently(cache, ("account",), loader)
+
+    assert loader.calls == 1
+    assert results == []
+    assert len(errors) == 8
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert cache.get(("account",), 10.0, lambda: "recovered") == "recovered"
+
+
+def test_base_exception_is_not_cached_as_none():
+    cache = RequestCache()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        cache.get(("account",), 10.0, interrupted)
+
+    assert cache.get(("account",), 10.0, lambda: "value") == "value"
@@ -1 +1,2 @@
 from .trade_engine import TradeEngine
+from .execution import ExecutionScheduler, ParentOrder
@@ -0,0 +1,519 @@
+import asyncio
+import logging
+import math
+import time
+
+# -----------------------------
+# Logger for this module
+# -----------------------------
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("TWAP", "POV", "ICEBERG")
+TERMINAL_ORDER_STATUSES = {"FILLED", "CANCELED", "REJECTED", "EXPIRED"}
+
+
+def _smallest_quantity(filters: dict) -> float:
+    """
+    Smallest quantity the exchange accepts: one lot step or minQty.
+    """
+    lot_filter = filters["LOT_SIZE"]
+    return max(float(lot_filter["stepSize"]), float(lot_filter["minQty"]))
+
+
+class ParentOrder:
+    """
+    A large order worked over time as a series of child orders.
+    Tracks fills, average price and slippage against the arrival price.
+    """
+
+    def __init__(self, parent_id: int, symbol: str, side: str, strategy: str,
+                 quantity: float, params: dict, filters: dict, arrival_price: float):
+        self.parent_id = parent_id
+        self.symbol = symbol
+        self.side = side
+        self.strategy = strategy
+        self.quantity = quantity
+        self.params = params
+        self.filters = filters
+        self.arrival_price = arrival_price
+
+        self.status = "PENDING"
+        self.error = None
+        self.executed_qty = 0.0
+        self.quote_qty = 0.0
+        self.child_order_ids = []
+
+        # Resting child order (iceberg slice) and the fills already booked for it
+        self.working_order_id = None
+        self.working_executed_qty = 0.0
+        self.working_quote_qty = 0.0
+
+    @property
+    def remaining_qty(self) -> float:
+        # Binance quantities have at most 8 decimals; rounding keeps summed
+        # fills (0.2 + 0.2 = 0.4000000000000001) from hiding the last lot
+        return max(round(self.quantity - self.executed_qty, 8), 0.0)
+
+    @property
+    def avg_price(self) -> float | None:
+        if self.executed_qty <= 0:
+            return None
+        return self.quote_qty / self.executed_qty
+
+    @property
+    def slippage_bps(self) -> float | None:
+        """
+        Positive means worse than arrival (paid more on BUY, got less on SELL).
+        """
+        avg = self.avg_price
+        if avg is None or not self.arrival_price:
+            return None
+        direction = 1 if self.side == "BUY" else -1
+        return direction * (avg - self.arrival_price) / self.arrival_price * 10_000
+
+    def record_fill(self, qty: float, quote_qty: float):
+        self.executed_qty += qty
+        self.quote_qty += quote_qty
+
+    def start_working(self, order_id: int):
+        self.working_order_id = order_id
+        self.working_executed_qty = 0.0
+        self.working_quote_qty = 0.0
+
+    def sync_working_fill(self, order) -> bool:
+        """
+        Books whatever the working order filled since the last sync.
+        Returns True if anything new was booked.
+        """
+        executed = order.executed_qty or 0.0
+        quote = order.quote_qty or 0.0
+        if executed <= self.working_executed_qty:
+            return False
+
+        self.record_fill(executed - self.working_executed_qty, quote - self.working_quote_qty)
+        self.working_executed_qty = executed
+        self.working_quote_qty = quote
+        return True
+
+    def summary(self) -> dict:
+        return {
+            "parent_id": self.parent_id,
+            "symbol": self.symbol,
+            "side": self.side,
+            "strategy": self.strategy,
+            "status": self.status,
+            "quantity": self.quantity,
+            "executed_qty": self.executed_qty,
+            "progress_pct": round(self.executed_qty / self.quantity * 100, 2),
+            "child_orders": len(self.child_order_ids),
+            "arrival_price": self.arrival_price,
+            "avg_price": self.avg_price,
+            "slippage_bps": self.slippage_bps,
+            "working_order_id": self.working_order_id,
+            "error": self.error,
+        }
+
+
+class ExecutionScheduler:
+    """
+    Works many parent orders concurrently on a single asyncio loop.
+
+    Child orders are timed against absolute loop deadlines so slices do not
+    drift, and blocking REST calls run in worker threads so one slow request
+    never delays another parent's timer.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.exchange = engine.exchange
+        self.parents = {}
+        self._tasks = {}
+        self._next_id = 1
+
+    # -----------------------------
+    # Public Interface
+    # -----------------------------
+    async def submit(self, parent_data: dict) -> ParentOrder:
+        """
+        parent_data examples:
+        {
+            "symbol": "BTCUSDT", "side": "BUY", "quantity": 0.5,
+            "strategy": "TWAP",
+            "duration": 600,             # seconds
+            "slices": 20
+        }
+        {
+            ..., "strategy": "POV",
+            "participation": 0.1,        # share of market volume, 0-1
+            "interval": 5,               # seconds between checks
+            "max_duration": 3600         # optional
+        }
+        {
+            ..., "strategy": "ICEBERG",
+            "price": 60000,              # limit price for every slice
+            "visible_quantity": 0.05,
+            "interval": 1                # fill polling interval
+        }
+        """
+
+        symbol = self.engine.validate_symbol(parent_data.get("symbol"))
+        side = self.engine.validate_side(parent_data.get("side"))
+        quantity = self.engine.safe_float(parent_data.get("quantity"), "quantity")
+        quantity = self.engine.validate_quantity(quantity)
+
+        strategy = parent_data.get("strategy", "").upper()
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unsupported strategy: {strategy}")
+
+        params = self._validate_params(strategy, parent_data)
+
+        # Filters and arrival price are fetched once per parent
+        filters, arrival_price = await asyncio.gather(
+            asyncio.to_thread(self.engine.get_symbol_filters, symbol),
+            asyncio.to_thread(self.engine.get_last_price, symbol),
+        )
+
+        smallest = _smallest_quantity(filters)
+        if quantity < smallest:
+            raise ValueError(f"Quantity below smallest tradable amount: {smallest}")
+
+        parent = ParentOrder(
+            parent_id=self._next_id,
+            symbol=symbol,
+            side=side,
+            strategy=strategy,
+            quantity=quantity,
+            params=params,
+            filters=filters,
+            arrival_price=arrival_price,
+        )
+        self._next_id += 1
+
+        self.parents[parent.parent_id] = parent
+        self._tasks[parent.parent_id] = asyncio.create_task(self._run_parent(parent))
+
+        logger.info(
+            "Parent order %s submitted | %s %s %s Qty=%s Arrival=%s",
+            parent.parent_id, strategy, side, symbol, quantity, arrival_price
+        )
+        return parent
+
+    def cancel(self, parent_id: int):
+        task = self._tasks.get(parent_id)
+        if task and not task.done():
+            task.cancel()
+
+    async def cancel_all(self):
+        """
+        Cancels every running parent and waits for their cleanup to finish.
+        """
+        tasks = [t for t in self._tasks.values() if not t.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def report(self) -> list:
+        return [p.summary() for p in self.parents.values()]
+
+    async def wait(self, report_interval: float | None = None, on_report=None):
+        """
+        Waits for every submitted parent to finish, optionally calling
+        on_report with the current summaries every report_interval seconds.
+        """
+        pending = set(self._tasks.values())
+
+        while pending:
+            done, pending = await asyncio.wait(pending, timeout=report_interval)
+            if on_report:
+                on_report(self.report())
+
+    # -----------------------------
+    # Parameter Validation
+    # -----------------------------
+    def _validate_params(self, strategy: str, parent_data: dict) -> dict:
+        safe_float = self.engine.safe_float
+
+        if strategy == "TWAP":
+            duration = safe_float(parent_data.get("duration"), "duration")
+            slices = int(safe_float(parent_data.get("slices"), "slices"))
+            if duration <= 0 or slices <= 0:
+                raise ValueError("TWAP needs a positive duration and slice count.")
+            return {"duration": duration, "slices": slices}
+
+        if strategy == "POV":
+            participation = safe_float(parent_data.get("participation"), "participation")
+            interval = safe_float(parent_data.get("interval", 5), "interval")
+            if not 0 < participation <= 1:
+                raise ValueError("POV participation must be between 0 and 1.")
+            if interval <= 0:
+                raise ValueError("POV interval must be greater than 0.")
+
+            max_duration = parent_data.get("max_duration")
+            if max_duration is not None:
+                max_duration = safe_float(max_duration, "max_duration")
+            return {
+                "participation": participation,
+                "interval": interval,
+                "max_duration": max_duration,
+            }
+
+        price = self.engine.validate_price(safe_float(parent_data.get("price"), "price"))
+        visible = safe_float(parent_data.get("visible_quantity"), "visible_quantity")
+        visible = self.engine.validate_quantity(visible)
+        interval = safe_float(parent_data.get("interval", 1), "interval")
+        if interval <= 0:
+            raise ValueError("ICEBERG interval must be greater than 0.")
+        return {"price": price, "visible_quantity": visible, "interval": interval}
+
+    # -----------------------------
+    # Strategy Runners
+    # -----------------------------
+    async def _run_parent(self, parent: ParentOrder):
+        parent.status = "RUNNING"
+        runner = {
+            "TWAP": self._run_twap,
+            "POV": self._run_pov,
+            "ICEBERG": self._run_iceberg,
+        }[parent.strategy]
+
+        try:
+            await runner(parent)
+            step = float(parent.filters["LOT_SIZE"]["stepSize"])
+            filled = parent.executed_qty > 0 and parent.remaining_qty < step
+            parent.status = "FILLED" if filled else "DONE"
+
+        except asyncio.CancelledError:
+            parent.status = "CANCELLED"
+            if parent.working_order_id is not None:
+                await asyncio.shield(self._cancel_working_child(parent))
+            raise
+
+        except Exception as e:
+            parent.status = "FAILED"
+            parent.error = str(e)
+            logger.exception("Parent order %s failed: %s", parent.parent_id, e)
+
+        finally:
+            logger.info("Parent order %s finished: %s", parent.parent_id, parent.summary())
+
+    async def _run_twap(self, parent: ParentOrder):
+        slices = parent.params["slices"]
+        interval = parent.params["duration"] / slices
+        start = asyncio.get_running_loop().time()
+
+        for k in range(slices):
+            await self._sleep_until(start + k * interval)
+            if self._is_complete(parent):
+                break
+
+            # Spread what is left over the remaining slices so quantities
+            # skipped by filter rounding are carried forward.
+            qty = parent.remaining_qty / (slices - k)
+            await self._place_market_child(parent, qty)
+
+    async def _run_pov(self, parent: ParentOrder):
+        interval = parent.params["interval"]
+        participation = parent.params["participation"]
+        max_duration = parent.params["max_duration"]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        last_check_ms = int(time.time() * 1000)
+        window_start_executed = 0.0
+        k = 0
+
+        while not self._is_complete(parent):
+            k += 1
+            await self._sleep_until(start + k * interval)
+
+            now_ms = int(time.time() * 1000)
+            volume = await asyncio.to_thread(
+                self.exchange.get_recent_volume, parent.symbol, last_check_ms, now_ms
+            )
+            last_check_ms = now_ms
+
+            # Our own children traded inside the window too; leave them out
+            # so they do not inflate the next child
+            own_volume = parent.executed_qty - window_start_executed
+            window_start_executed = parent.executed_qty
+            market_volume = max(volume - own_volume, 0.0)
+
+            qty = min(market_volume * participation, parent.remaining_qty)
+            if qty > 0:
+                await self._place_market_child(parent, qty)
+
+            if max_duration is not None and loop.time() - start >= max_duration:
+                break
+
+    async def _run_iceberg(self, parent: ParentOrder):
+        price = parent.params["price"]
+        visible = parent.params["visible_quantity"]
+        interval = parent.params["interval"]
+
+        while not self._is_complete(parent):
+            qty = self._quantize(parent, min(visible, parent.remaining_qty), price)
+            if qty is None:
+                break
+
+            order = await self._send_child(
+                parent,
+                self.exchange.place_limit_order,
+                working=True,
+                quantity=qty,
+                price=price
+            )
+
+            # Poll the visible slice until it leaves the book
+            start = asyncio.get_running_loop().time()
+            k = 0
+            while True:
+                if parent.sync_working_fill(order):
+                    self._log_progress(parent)
+
+                if order.status in TERMINAL_ORDER_STATUSES:
+                    break
+
+                k += 1
+                await self._sleep_until(start + k * interval)
+                order = await asyncio.to_thread(
+                    self.exchange.get_order_by_id,
+                    symbol=parent.symbol,
+                    order_id=parent.working_order_id
+                )
+
+            parent.working_order_id = None
+            if order.status != "FILLED":
+                raise RuntimeError(
+                    f"Iceberg slice {order.order_id} ended with status {order.status}"
+                )
+
+    # -----------------------------
+    # Child Order Helpers
+    # -----------------------------
+    async def _place_market_child(self, parent: ParentOrder, quantity: float):
+        # Arrival price stands in for the unknown fill price in MIN_NOTIONAL
+        qty = self._quantize(parent, quantity, parent.arrival_price)
+        if qty is None:
+            return
+
+        await self._send_child(
+            parent,
+            self.exchange.place_market_order,
+            working=False,
+            quantity=qty
+        )
+
+    async def _send_child(self, parent: ParentOrder, place, working: bool, **params):
+        """
+        Places a child order in a worker thread and books it on the parent.
+
+        Once sent, a request cannot be recalled, so if the parent is cancelled
+        mid-request the placement is still awaited and booked before the
+        cancellation propagates. Working (resting) children are then cancelled
+        by _run_parent like any other working slice.
+        """
+        def place_and_normalize():
+            # ACK-only responses carry no fills; fetch the full order so a
+            # filled child is never booked as zero and re-sent
+            order = place(symbol=parent.symbol, side=parent.side, **params)
+            return self.engine.normalize_order_response(order)
+
+        placement = asyncio.ensure_future(asyncio.to_thread(place_and_normalize))
+
+        try:
+            order = await asyncio.shield(placement)
+        except asyncio.CancelledError:
+            try:
+                order = await placement
+            except Exception as e:
+                logger.exception(
+                    "Child placement for parent %s failed during cancel: %s",
+                    parent.parent_id, e
+                )
+            else:
+                self._book_child(parent, order, working)
+            raise
+
+        self._book_child(parent, order, working)
+        return order
+
+    def _book_child(self, parent: ParentOrder, order, working: bool):
+        parent.child_order_ids.append(order.order_id)
+        if working:
+            parent.start_working(order.order_id)
+            parent.sync_working_fill(order)
+        else:
+            parent.record_fill(order.executed_qty or 0.0, order.quote_qty or 0.0)
+        self._log_progress(parent)
+
+    def _quantize(self, parent: ParentOrder, quantity: float,
+                  price: float | None = None) -> float | None:
+        """
+        Snaps a child quantity onto the LOT_SIZE grid without exceeding what
+        is left. Returns None when the slice is too small to send (LOT_SIZE or
+        MIN_NOTIONAL), so it rolls into the next slice instead.
+        """
+        step = float(parent.filters["LOT_SIZE"]["stepSize"])
+        quantity = math.floor(min(quantity, parent.remaining_qty) / step + 1e-9) * step
+
+        try:
+            return self.engine.apply_exchange_filters(
+                parent.symbol, quantity, price, filters=parent.filters
+            )
+        except ValueError as e:
+            logger.info("Parent order %s skipped slice: %s", parent.parent_id, e)
+            return None
+
+    async def _cancel_working_child(self, parent: ParentOrder):
+        order_id = parent.working_order_id
+        try:
+            order = await asyncio.to_thread(
+                self.exchange.cancel_order, parent.symbol, order_id
+            )
+        except Exception as e:
+            # Typically the slice filled after the last poll (unknown order);
+            # look it up so its fills are still booked
+            logger.exception(
+                "Failed to cancel child %s of parent %s: %s",
+                order_id, parent.parent_id, e
+            )
+            try:
+                order = await asyncio.to_thread(
+                    self.exchange.get_order_by_id,
+                    symbol=parent.symbol,
+                    order_id=order_id
+                )
+            except Exception as e:
+                logger.exception(
+                    "Failed to fetch child %s of parent %s: %s",
+                    order_id, parent.parent_id, e
+                )
+                return
+
+        # The slice may have partly or fully filled before the cancel landed
+        parent.sync_working_fill(order)
+        if order.status in TERMINAL_ORDER_STATUSES:
+            parent.working_order_id = None
+        else:
+            logger.error(
+                "Child %s of parent %s is still open with status %s",
+                order_id, parent.parent_id, order.status
+            )
+
+    def _is_complete(self, parent: ParentOrder) -> bool:
+        """
+        True once nothing sendable is left.
+        """
+        return parent.remaining_qty < _smallest_quantity(parent.filters)
+
+    def _log_progress(self, parent: ParentOrder):
+        logger.info(
+            "Parent order %s progress | Executed=%s/%s AvgPrice=%s SlippageBps=%s",
+            parent.parent_id, parent.executed_qty, parent.quantity,
+            parent.avg_price, parent.slippage_bps
+        )
+
+    async def _sleep_until(self, deadline: float):
+        delay = deadline - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -1,30 +1,33 @@
-from exchange import BinanceExchangeClient
+from decimal import Decimal
+
+from exchange import BinanceExchangeClient, Order
 
 
 class TradeEngine:
-    def __init__(self):
-        self.exchange = BinanceExchangeClient()
+    def __init__(self, exchange=None):
+        # An exchange client can be injected (e.g. a stub in tests)
+        self.exchange = exchange if exchange is not None else BinanceExchangeClient()
 
     # -----------------------------
     # Validation Helpers
     # -----------------------------
-    def _validate_symbol(self, symbol: str) -> str:
+    def validate_symbol(self, symbol: str) -> str:
         if not symbol or not isinstance(symbol, str):
             raise ValueError("Invalid symbol.")
         return symbol.upper()
 
-    def _validate_side(self, side: str) -> str:
+    def validate_side(self, side: str) -> str:
         side = side.upper()
         if side not in ("BUY", "SELL"):
             raise ValueError("Side must be BUY or SELL.")
         return side
 
-    def _validate_quantity(self, quantity: float) -> float:
+    def validate_quantity(self, quantity: float) -> float:
         if quantity <= 0:
             raise ValueError("Quantity must be greater than 0.")
         return float(quantity)
 
-    def _validate_price(self, price: float) -> float:
+    def validate_price(self, price: float) -> float:
         if price <= 0:
             raise ValueError("Price must be greater than 0.")
         return float(price)
@@ -32,7 +35,7 @@ class TradeEngine:
     # -----------------------------
     # Public Trade Interface
     # -----------------------------
-    def execute_trade(self, order_data: dict) -> dict:
+    def execute_trade(self, order_data: dict) -> Order:
         """
         order_data example:
         {
@@ -45,18 +48,18 @@ class TradeEngine:
         }
         """
 
-        symbol = self._validate_symbol(order_data.get("symbol"))
-        side = self._validate_side(order_data.get("side"))
+        symbol = self.validate_symbol(order_data.get("symbol"))
+        side = self.validate_side(order_data.get("side"))
         order_type = order_data.get("type", "").upper()
 
         # ---- SAFE QUANTITY PARSING ----
         raw_qty = order_data.get("quantity")
-        quantity = self._safe_float(raw_qty, "quantity")
-        quantity = self._validate_quantity(quantity)
+        quantity = self.safe_float(raw_qty, "quantity")
+        quantity = self.validate_quantity(quantity)
 
         if order_type == "MARKET":
             # Apply LOT_SIZE filter (price not needed for MARKET)
-            quantity = self._apply_exchange_filters(symbol, quantity)
+            quantity = self.apply_exchange_filters(symbol, quantity)
 
             order = self.exchange.place_market_order(
                 symbol=symbol,
@@ -70,11 +73,11 @@ class TradeEngine:
 
             # ---- SAFE PRICE PARSING ----
             raw_price = order_data.get("price")
-            price = self._safe_float(raw_price, "price")
-            price = self._validate_price(price)
+            price = self.safe_float(raw_price, "price")
+            price = self.validate_price(price)
 
             # Apply LOT_SIZE + MIN_NOTIONAL filters
-            quantity = self._apply_exchange_filters(symbol, quantity, price)
+            quantity = self.apply_exchange_filters(symbol, quantity, price)
 
             order = self.exchange.place_limit_order(
                 symbol=symbol,
@@ -89,15 +92,15 @@ class TradeEngine:
 
             # ---- SAFE PRICE PARSING ----
             raw_price = order_data.get("price")
-            price = self._safe_float(raw_price, "price")
-            price = self._validate_price(price)
+            price = self.safe_float(raw_price, "price")
+            price = self.validate_price(price)
 
             raw_stop = order_data.get("stop_price")
-            stop_price = self._safe_float(raw_stop, "stop_price")
-            stop_price = self._validate_price(stop_price)
+            stop_price = self.safe_float(raw_stop, "stop_price")
+            stop_price = self.validate_price(stop_price)
 
             # Apply LOT_SIZE + MIN_NOTIONAL filters
-            quantity = self._apply_exchange_filters(symbol, quantity, price)
+            quantity = self.apply_exchange_filters(symbol, quantity, price)
 
             order = self.exchange.place_stop_limit_order(
                 symbol=symbol,
@@ -110,39 +113,24 @@ class TradeEngine:
         else:
             raise ValueError(f"Unsupported order type: {order_type}")
 
-        return self._normalize_order_response(order)
+        return self.normalize_order_response(order)
 
     # -----------------------------
     # Response Normalizer
     # -----------------------------
-    def _normalize_order_response(self, raw_order: dict) -> dict:
+    def normalize_order_response(self, order: Order) -> Order:
         """
-        Always ensures a full order payload even if Binance returns ACK-only.
+        Always ensures a full order record even if Binance returns ACK-only.
         """
 
         # If status is missing, fetch full order from exchange
-        if "status" not in raw_order or raw_order.get("status") is None:
-            order_id = raw_order.get("orderId")
-            symbol = raw_order.get("symbol")
-
-            if order_id and symbol:
-                raw_order = self.exchange.get_order_by_id(
-                    symbol=symbol,
-                    order_id=order_id
-                )
-
-        normalized = {
-            "order_id": raw_order.get("orderId"),
-            "symbol": raw_order.get("symbol"),
-            "side": raw_order.get("side"),
-            "type": raw_order.get("type"),
-            "status": raw_order.get("status"),
-            "price": raw_order.get("price"),
-            "orig_qty": raw_order.get("origQty"),
-            "executed_qty": raw_order.get("executedQty"),
-        }
+        if order.status is None and order.order_id and order.symbol:
+            order = self.exchange.get_order_by_id(
+                symbol=order.symbol,
+                order_id=order.order_id
+            )
 
-        return normalized
+        return order
     # -----------------------------
     # Account & Order Management
     # -----------------------------
@@ -154,8 +142,25 @@ class TradeEngine:
 
     def cancel_order(self, symbol: str, order_id: int):
         return self.exchange.cancel_order(symbol, order_id)
-    def _apply_exchange_filters(self, symbol: str, quantity: float, price: float | None = None):
-        filters = self.exchange.get_symbol_filters(symbol)
+
+    def get_symbol_filters(self, symbol: str):
+        return self.exchange.get_symbol_filters(self.validate_symbol(symbol))
+
+    def get_symbol_assets(self, symbol: str) -> tuple:
+        return self.exchange.get_symbol_assets(self.validate_symbol(symbol))
+
+    def get_last_price(self, symbol: str) -> float:
+        return self.exchange.get_last_price(self.validate_symbol(symbol))
+    def apply_exchange_filters(
+        self,
+        symbol: str,
+        quantity: float,
+        price: float | None = None,
+        filters: dict | None = None,
+    ):
+        # Callers placing many orders on one symbol can pass cached filters
+        if filters is None:
+            filters = self.exchange.get_symbol_filters(symbol)
 
         lot_filter = filters.get("LOT_SIZE")
         min_notional_filter = filters.get("MIN_NOTIONAL")
@@ -164,8 +169,11 @@ class TradeEngine:
         min_qty = float(lot_filter["minQty"])
         max_qty = float(lot_filter["maxQty"])
 
-        # Enforce LOT_SIZE
+        # Enforce LOT_SIZE, formatted to the step's decimals so float noise
+        # from the multiply (e.g. 0.30000000000000004) never reaches Binance
         quantity = round(quantity / step_size) * step_size
+        step = Decimal(lot_filter["stepSize"]).normalize()
+        quantity = float(Decimal(repr(quantity)).quantize(step))
 
         if quantity < min_qty:
             raise ValueError(f"Quantity below minimum allowed: {min_qty}")
@@ -185,7 +193,7 @@ class TradeEngine:
                 )
 
         return quantity
-    def _safe_float(self, value, field_name: str):
+    def safe_float(self, value, field_name: str):
         try:
             return float(value)
         except (TypeError, ValueError):
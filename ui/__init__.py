@@ -1 +1,2 @@
 from .cli import TradingCLI
+from .dashboard import LiveDashboard
@@ -1,4 +1,7 @@
-from trading import TradeEngine
+import asyncio
+
+from trading import TradeEngine, ExecutionScheduler
+from .dashboard import LiveDashboard, IMPORTANT_ASSETS
 
 
 class TradingCLI:
@@ -11,7 +14,9 @@ class TradingCLI:
         print("2. View Balances")
         print("3. View Open Orders")
         print("4. Cancel Order")
-        print("5. Exit")
+        print("5. Live Dashboard")
+        print("6. Execute Parent Order (TWAP / POV / ICEBERG)")
+        print("7. Exit")
 
     def place_order_flow(self):
         symbol = input("Enter trading symbol (e.g., BTCUSDT): ").strip().upper()
@@ -45,29 +50,24 @@ class TradingCLI:
         result = self.engine.execute_trade(order_data)
 
         print("----- ORDER RESULT -----")
-        for key, value in result.items():
+        for key, value in result.as_dict().items():
             print(f"{key}: {value}")
 
     def view_balances_flow(self):
         balances = self.engine.get_balances()
 
-        important_assets = {"USDT", "BTC", "ETH", "BNB"}
         show_all = input("Show all assets? (y/n): ").strip().lower() == "y"
 
         print("----- ACCOUNT BALANCES -----")
         shown = False
 
-        for asset in balances:
-            symbol = asset["asset"]
-            free = float(asset["free"])
-            locked = float(asset["locked"])
-
-            if not show_all and symbol not in important_assets:
+        for b in balances:
+            if not show_all and b.asset not in IMPORTANT_ASSETS:
                 continue
 
-            if free > 0 or locked > 0:
+            if b.free > 0 or b.locked > 0:
                 shown = True
-                print(f"{symbol}: Free={free}, Locked={locked}")
+                print(f"{b.asset}: Free={b.free}, Locked={b.locked}")
 
         if not shown:
             print("No balances to display.")
@@ -85,8 +85,8 @@ class TradingCLI:
         print("----- OPEN ORDERS -----")
         for o in orders:
             print(
-                f"OrderID={o['orderId']} | {o['symbol']} | {o['side']} | "
-                f"{o['type']} | Price={o['price']} | Qty={o['origQty']} | Status={o['status']}"
+                f"OrderID={o.order_id} | {o.symbol} | {o.side} | "
+                f"{o.type} | Price={o.price} | Qty={o.orig_qty} | Status={o.status}"
             )
 
     def cancel_order_flow(self):
@@ -99,13 +99,95 @@ class TradingCLI:
             return
 
         result = self.engine.cancel_order(symbol, order_id)
-        print("Cancel result:", result.get("status", result))
+        print("Cancel result:", result.status or result)
+
+    def live_dashboard_flow(self):
+        raw = input("Enter symbols to watch, comma separated (default BTCUSDT): ").strip().upper()
+        symbols = [s.strip() for s in raw.split(",") if s.strip()] or ["BTCUSDT"]
+
+        LiveDashboard(self.engine, symbols).run()
+
+    def parent_order_flow(self):
+        symbol = input("Enter trading symbol (e.g., BTCUSDT): ").strip().upper()
+        side = input("Enter side (BUY / SELL): ").strip().upper()
+        strategy = input("Enter strategy (TWAP / POV / ICEBERG): ").strip().upper()
+        quantity = float(input("Enter total quantity: ").strip())
+
+        parent_data = {
+            "symbol": symbol,
+            "side": side,
+            "strategy": strategy,
+            "quantity": quantity
+        }
+
+        if strategy == "TWAP":
+            parent_data["duration"] = float(input("Enter duration in seconds: ").strip())
+            parent_data["slices"] = int(input("Enter number of slices: ").strip())
+
+        elif strategy == "POV":
+            parent_data["participation"] = float(input("Enter participation rate (e.g., 0.1): ").strip())
+            parent_data["interval"] = float(input("Enter check interval in seconds: ").strip())
+            max_duration = input("Enter max duration in seconds (or press Enter for none): ").strip()
+            if max_duration:
+                parent_data["max_duration"] = float(max_duration)
+
+        elif strategy == "ICEBERG":
+            parent_data["price"] = float(input("Enter limit price: ").strip())
+            parent_data["visible_quantity"] = float(input("Enter visible quantity per slice: ").strip())
+
+        confirm = input("Confirm parent order? (y/n): ").strip().lower()
+        if confirm != "y":
+            print("Order cancelled by user.")
+            return
+
+        print("\nExecuting parent order... (Ctrl+C to cancel)")
+
+        # Created outside asyncio.run so the parent survives an interrupt
+        scheduler = ExecutionScheduler(self.engine)
+        try:
+            asyncio.run(self._run_parent_order(scheduler, parent_data))
+        except KeyboardInterrupt:
+            print("\nParent order cancelled.")
+
+        reports = scheduler.report()
+        if not reports:
+            print("Parent order was not submitted.")
+            return
+
+        print("----- EXECUTION RESULT -----")
+        summary = reports[0]
+        for key, value in summary.items():
+            print(f"{key}: {value}")
+
+        if summary["working_order_id"] is not None:
+            print(
+                f"WARNING: child order {summary['working_order_id']} could not be "
+                f"cancelled and may still be open on the book."
+            )
+
+    async def _run_parent_order(self, scheduler: ExecutionScheduler, parent_data: dict):
+        await scheduler.submit(parent_data)
+
+        def show_progress(reports):
+            for r in reports:
+                print(
+                    f"[{r['status']}] {r['executed_qty']}/{r['quantity']} "
+                    f"({r['progress_pct']}%) | Avg={r['avg_price']} | "
+                    f"Slippage={r['slippage_bps']} bps"
+                )
+
+        try:
+            await scheduler.wait(report_interval=5, on_report=show_progress)
+        except asyncio.CancelledError:
+            # Ctrl+C: cancel the parent and let it clean up its working child
+            await scheduler.cancel_all()
+            raise
 
     def run(self):
         while True:
             try:
                 self.show_menu()
-                choice = input("Select option (1-5): ").strip()
+                choice = input("Select option (1-7): ").strip()
 
                 if choice == "1":
                     self.place_order_flow()
@@ -120,6 +202,12 @@ class TradingCLI:
                     self.cancel_order_flow()
 
                 elif choice == "5":
+                    self.live_dashboard_flow()
+
+                elif choice == "6":
+                    self.parent_order_flow()
+
+                elif choice == "7":
                     print("Exiting trading terminal.")
                     break
 
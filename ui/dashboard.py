@@ -0,0 +1,322 @@
+import logging
+import shutil
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from exchange import BinanceStreamClient, Order, Balance
+
+# -----------------------------
+# Logger for this module
+# -----------------------------
+logger = logging.getLogger(__name__)
+
+RESEED_RETRY_SECONDS = 5.0
+OPEN_ORDER_STATUSES = {"NEW", "PARTIALLY_FILLED"}
+IMPORTANT_ASSETS = {"USDT", "BTC", "ETH", "BNB"}
+
+# ANSI control sequences
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+
+class DashboardState:
+    """
+    In-memory view of balances, open orders, prices and fills.
+    Seeded over REST, then kept current by stream events. User events that
+    arrive before the seed are buffered and replayed on top of it. A stream
+    error marks the state stale until it is re-seeded.
+    """
+
+    def __init__(self, max_fills: int = 10):
+        self._lock = threading.Lock()
+        self.balances = {}
+        self.open_orders = {}
+        self.prices = {}
+        self.fills = deque(maxlen=max_fills)
+        self.version = 0
+        self.updated_at = None
+        self.stale = False
+        self._seeded = False
+        self._pending_events = []
+
+    # -----------------------------
+    # Seeding
+    # -----------------------------
+    def load_snapshot(self, balances: list, open_orders: list):
+        with self._lock:
+            self.balances = {b.asset: b for b in balances}
+            self.open_orders = {o.order_id: o for o in open_orders}
+
+            for msg in self._pending_events:
+                self._apply_user_event(msg)
+            self._pending_events = []
+            self._seeded = True
+            self.stale = False
+
+            self._touch()
+
+    def mark_stale(self, msg: dict | None = None):
+        """
+        Called on stream errors: events may have been lost, so buffer new
+        ones until the next seed reconciles the state.
+        """
+        with self._lock:
+            if self.stale:
+                return
+            self.stale = True
+            self._seeded = False
+            self._touch()
+
+    # -----------------------------
+    # Stream Handlers
+    # -----------------------------
+    def on_user_event(self, msg: dict):
+        with self._lock:
+            if not self._seeded:
+                self._pending_events.append(msg)
+                return
+
+            if self._apply_user_event(msg):
+                self._touch()
+
+    def _apply_user_event(self, msg: dict) -> bool:
+        """
+        Applies one user data event. Caller must hold the lock.
+        """
+        event_type = msg.get("e")
+
+        if event_type == "outboundAccountPosition":
+            for raw in msg.get("B", []):
+                b = Balance.from_account_position(raw)
+                self.balances[b.asset] = b
+            return True
+
+        if event_type == "executionReport":
+            order = Order.from_execution_report(msg)
+
+            if order.status in OPEN_ORDER_STATUSES:
+                self.open_orders[order.order_id] = order
+            else:
+                self.open_orders.pop(order.order_id, None)
+
+            if msg.get("x") == "TRADE":
+                self.fills.appendleft({
+                    "time": msg.get("T"),
+                    "symbol": msg["s"],
+                    "side": msg["S"],
+                    "qty": float(msg["l"]),
+                    "price": float(msg["L"]),
+                })
+            return True
+
+        return False
+
+    def on_ticker_event(self, msg: dict):
+        symbol = msg.get("s")
+        price = msg.get("c")
+        if not symbol or price is None:
+            return
+
+        price = float(price)
+        with self._lock:
+            # Only a real price move counts as a change worth redrawing
+            if self.prices.get(symbol) != price:
+                self.prices[symbol] = price
+                self._touch()
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+    def snapshot(self):
+        with self._lock:
+            return {
+                "version": self.version,
+                "updated_at": self.updated_at,
+                "stale": self.stale,
+                "balances": dict(self.balances),
+                "open_orders": list(self.open_orders.values()),
+                "prices": dict(self.prices),
+                "fills": list(self.fills),
+            }
+
+    def _touch(self):
+        self.version += 1
+        self.updated_at = time.time()
+
+
+class LiveDashboard:
+    """
+    Terminal dashboard that redraws from DashboardState.
+    A refresh makes no REST calls; only lines that changed are rewritten.
+    """
+
+    def __init__(self, engine, symbols: list, refresh_hz: float = 4.0, out=None):
+        self.engine = engine
+        self.symbols = symbols
+        self.interval = 1.0 / refresh_hz
+        self.out = out or sys.stdout
+        self.state = DashboardState()
+        self.streams = None
+        self.assets = set(IMPORTANT_ASSETS)
+        self._next_reseed = 0.0
+        self._rendered_version = -1
+        self._previous_lines = []
+
+    def run(self):
+        self.resolve_assets()
+        self.streams = BinanceStreamClient()
+        console_handlers = self._mute_console_logging()
+        self.out.write(HIDE_CURSOR + CLEAR_SCREEN)
+        try:
+            # Subscribe before the REST snapshot so no event falls in the
+            # gap; events that beat the snapshot are replayed on top of it.
+            self.streams.subscribe_user_data(
+                self.state.on_user_event, on_error=self.state.mark_stale
+            )
+            for symbol in self.symbols:
+                self.streams.subscribe_mini_ticker(
+                    symbol, self.state.on_ticker_event, on_error=self.state.mark_stale
+                )
+
+            self.seed()
+
+            while True:
+                if self.state.stale and time.monotonic() >= self._next_reseed:
+                    self._reseed()
+                self.refresh()
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.streams.stop()
+            row = len(self._previous_lines) + 1
+            self.out.write(f"\x1b[{row};1H{SHOW_CURSOR}\n")
+            self.out.flush()
+            self._restore_console_logging(console_handlers)
+
+    def resolve_assets(self):
+        """
+        Spot accounts can hold hundreds of assets; show the usual ones plus
+        the base and quote assets of every watched symbol.
+        """
+        for symbol in self.symbols:
+            self.assets.update(self.engine.get_symbol_assets(symbol))
+
+    def seed(self):
+        self.state.load_snapshot(
+            self.engine.get_balances(),
+            self.engine.get_open_orders()
+        )
+
+    def _reseed(self):
+        try:
+            self.seed()
+            logger.info("Dashboard state re-seeded after stream error")
+        except Exception as e:
+            logger.exception("Dashboard re-seed failed: %s", e)
+            self._next_reseed = time.monotonic() + RESEED_RETRY_SECONDS
+
+    def _mute_console_logging(self) -> list:
+        """
+        Console log lines would scroll the absolutely positioned frame, so
+        detach console handlers while the dashboard owns the terminal.
+        The file handler keeps logging.
+        """
+        root = logging.getLogger()
+        handlers = [
+            h for h in root.handlers
+            if isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)
+        ]
+        for h in handlers:
+            root.removeHandler(h)
+        return handlers
+
+    def _restore_console_logging(self, handlers: list):
+        root = logging.getLogger()
+        for h in handlers:
+            root.addHandler(h)
+
+    def refresh(self):
+        if self.state.version == self._rendered_version:
+            return
+
+        snap = self.state.snapshot()
+        lines = self._build_frame(snap)
+
+        # Rows are addressed absolutely, so the frame must fit the terminal
+        height = shutil.get_terminal_size().lines
+        if len(lines) > height:
+            hidden = len(lines) - height + 1
+            lines = lines[:height - 1] + [f"  ... {hidden} more lines (enlarge terminal)"]
+
+        self._draw(lines)
+        self._rendered_version = snap["version"]
+
+    # -----------------------------
+    # Rendering
+    # -----------------------------
+    def _build_frame(self, snap: dict) -> list:
+        updated = "-"
+        if snap["updated_at"]:
+            updated = datetime.fromtimestamp(snap["updated_at"]).strftime("%H:%M:%S")
+
+        status = f"last update {updated}"
+        if snap["stale"]:
+            status = f"STALE since {updated}, resyncing"
+
+        lines = [
+            f"----- LIVE DASHBOARD ({status}) -----  Ctrl+C to exit",
+            "",
+            "PRICES",
+        ]
+        for symbol in self.symbols:
+            price = snap["prices"].get(symbol)
+            lines.append(f"  {symbol:<12} {price if price is not None else '-'}")
+
+        lines += ["", "BALANCES"]
+        for asset, b in sorted(snap["balances"].items()):
+            if asset not in self.assets:
+                continue
+            if b.free > 0 or b.locked > 0:
+                lines.append(f"  {asset:<8} Free={b.free} Locked={b.locked}")
+
+        lines += ["", "OPEN ORDERS"]
+        if not snap["open_orders"]:
+            lines.append("  No open orders.")
+        for o in snap["open_orders"]:
+            lines.append(
+                f"  OrderID={o.order_id} | {o.symbol} | {o.side} | "
+                f"{o.type} | Price={o.price} | Qty={o.orig_qty} | Status={o.status}"
+            )
+
+        lines += ["", "RECENT FILLS"]
+        if not snap["fills"]:
+            lines.append("  No fills yet.")
+        for f in snap["fills"]:
+            fill_time = "-"
+            if f["time"]:
+                fill_time = datetime.fromtimestamp(f["time"] / 1000).strftime("%H:%M:%S")
+            lines.append(f"  {fill_time} | {f['symbol']} | {f['side']} | Qty={f['qty']} @ {f['price']}")
+
+        return lines
+
+    def _draw(self, lines: list):
+        parts = []
+        for row, line in enumerate(lines):
+            if row >= len(self._previous_lines) or self._previous_lines[row] != line:
+                parts.append(f"\x1b[{row + 1};1H{line}{CLEAR_LINE_END}")
+
+        if len(lines) < len(self._previous_lines):
+            parts.append(f"\x1b[{len(lines) + 1};1H{CLEAR_BELOW}")
+
+        if parts:
+            self.out.write("".join(parts))
+            self.out.flush()
+
+        self._previous_lines = lines